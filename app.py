@@ -3,7 +3,8 @@
 Web interface for Email Finder
 """
 import os
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash
+import json
+from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, Response, stream_with_context
 from flask_wtf import FlaskForm
 from flask_wtf.csrf import CSRFProtect
 from wtforms import StringField, SubmitField, BooleanField
@@ -53,7 +54,7 @@ def index():
                 return render_template('index.html', form=form, theme='dark')
             
             # Find emails
-            results = finder.find_emails(first_name, last_name, company, additional_domains)
+            results = finder.find_emails(first_name, last_name, company, additional_domains, profile_info=profile_info)
             
         except Exception as e:
             flash(f'Error: {str(e)}', 'danger')
@@ -86,10 +87,10 @@ def api_find_emails():
             return jsonify({'error': 'Could not process profile information'}), 404
         
         # Find emails
-        results = finder.find_emails(first_name, last_name, company, additional_domains)
+        results = finder.find_emails(first_name, last_name, company, additional_domains, profile_info=profile_info)
         
         return jsonify({
-            'profile': profile_info,
+            'profile': _public_profile(profile_info),
             'emails': results
         })
         
@@ -98,5 +99,58 @@ def api_find_emails():
     finally:
         finder.cleanup()
 
+def _public_profile(profile_info):
+    """Drop internal (underscore-prefixed) keys from a profile before sending it"""
+    return {key: value for key, value in profile_info.items() if not key.startswith('_')}
+
+def _sse(data, event=None):
+    """Format a Server-Sent Event"""
+    message = f"event: {event}\n" if event else ""
+    return message + f"data: {json.dumps(data)}\n\n"
+
+@app.route('/stream-emails', methods=['POST'])
+def stream_emails():
+    """Stream verified emails to the browser as Server-Sent Events
+    
+    Takes the same (CSRF-protected) form as the index page in a POST body, so
+    other sites can't start searches and names stay out of the access log.
+    """
+    form = EmailFinderForm()
+    if not form.validate():
+        return jsonify({'error': 'First name, last name, and company are required'}), 400
+    
+    first_name = form.first_name.data.strip()
+    last_name = form.last_name.data.strip()
+    company = form.company.data.strip()
+    additional_domains = [domain.strip() for domain in (form.additional_domains.data or '').split(',') if domain.strip()]
+    headless = form.headless.data
+    
+    def generate():
+        finder = EmailFinder(headless=headless)
+        
+        try:
+            # Extract profile info
+            profile_info = finder.extract_profile_info(first_name, last_name, company)
+            
+            if not profile_info:
+                yield _sse({'error': 'Could not process profile information'}, event='failure')
+                return
+            
+            yield _sse(_public_profile(profile_info), event='profile')
+            
+            # Send each email as soon as its domain has been verified
+            for email_info in finder.iter_emails(first_name, last_name, company, additional_domains, profile_info=profile_info):
+                yield _sse(email_info)
+            
+            yield _sse({}, event='done')
+            
+        except Exception as e:
+            yield _sse({'error': str(e)}, event='failure')
+        finally:
+            finder.cleanup()
+    
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 if __name__ == '__main__':
     app.run(debug=True)
@@ -3,34 +3,901 @@
 Email Finder - A tool to find work emails using first name, last name, and company domain
 """
 import os
+import sys
 import re
 import time
 import random
 import argparse
-import validators
+import logging
+import threading
+import functools
+import atexit
+import signal
+import uuid
+import unicodedata
+import socket
+import smtplib
 import json
+import copy
+import hashlib
+import sqlite3
+import socketserver
+import tempfile
 import requests
-from urllib.parse import urlparse, quote_plus
-from typing import List, Dict, Any, Optional, Tuple
+import dns.resolver
+import dns.exception
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Tuple, Callable, Iterator
 from dotenv import load_dotenv
-
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
 from tqdm import tqdm
-from colorama import Fore, Style, init
+from colorama import Fore, Style, just_fix_windows_console
+
+class _NoColor:
+    """Stands in for colorama's Fore/Style, giving an empty string for every color"""
+    
+    def __getattr__(self, name: str) -> str:
+        return ""
+
+if sys.stdout.isatty():
+    # Turns on ANSI handling in old Windows consoles; unlike init(), it never
+    # wraps stdout, so writes go straight to the stream
+    just_fix_windows_console()
+else:
+    # Keep escape codes out of pipes and log files
+    Fore = Style = _NoColor()
+
+# Per-candidate and per-snippet diagnostics; console output is kept to progress and results
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    # Selenium is imported where drivers are launched, so runs that never need
+    # a browser don't pay for loading it
+    from selenium.webdriver.chrome.options import Options
+
+try:
+    import redis
+except ImportError:  # Redis is optional; it only shares caches between processes
+    redis = None
 
-# Initialize colorama
-init(autoreset=True)
+try:
+    import orjson
+except ImportError:  # orjson is optional; it only speeds up JSON encoding and decoding
+    orjson = None
 
 # Load environment variables
 load_dotenv()
 
+# DNS-over-HTTPS resolver used when the system resolver can't answer
+DOH_URL = "https://dns.google/resolve"
+DNS_RECORD_TYPES = {"A": 1, "MX": 15}
+DOH_DEFINITIVE_STATUS = frozenset({0, 3})  # NOERROR, NXDOMAIN; anything else (e.g. SERVFAIL) is a failure
+DNS_CACHE_TTL = 3600  # Seconds a DNS answer is reused (locally and through Redis)
+FORMAT_CACHE_TTL = 86400  # Seconds a company's discovered email format is reused
+FORMAT_MISS_TTL = 3600    # Seconds the common-format fallback is reused when no format was found
+DOMAIN_CACHE_TTL = 86400  # Seconds a company's discovered domain is reused
+DOMAIN_MISS_TTL = 3600    # Seconds a guessed company.com domain is reused when nothing was found
+CATCH_ALL_TTL = 86400     # Seconds a domain's catch-all verdict is reused
+SEARCH_RATE = 1.0         # Custom Search requests per second, shared by all threads
+SEARCH_BURST = 5          # Requests that may go out back to back before SEARCH_RATE applies
+SEARCH_CACHE_TTL = 86400  # Seconds a Custom Search response is reused from the on-disk cache
+DNS_MISS_TTL = 86400      # Seconds a domain with no A or MX records is remembered on disk (answers use DNS_CACHE_TTL)
+DISK_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "bcon", "cache.sqlite")
+DISK_CACHE_PRUNE_EVERY = 500  # Writes between sweeps of expired on-disk entries (one sweep also runs on open)
+SERVE_MAX_QUERIES = 4     # Queries a daemon (--serve) verifies at once; others wait their turn
+
+# Address shape check: a dot-atom local part of at most 64 characters, then a dotted domain.
+# Candidates failing it would be rejected by the server anyway, so they're never probed
+_EMAIL_RE = re.compile(r"(?=[^@]{1,64}@)[a-z0-9%+_-]+(?:\.[a-z0-9%+_-]+)*@[^@\s]+\.[^@\s]+", re.IGNORECASE)
+
+# Address builders for each known email format: (first_name, last_name, domain) -> email
+_FORMAT_BUILDERS: Dict[str, Callable[[str, str, str], str]] = {
+    'firstname@': lambda f, l, d: f"{f}@{d}",
+    'firstname.lastname@': lambda f, l, d: f"{f}.{l}@{d}",
+    'firstinitial.lastname@': lambda f, l, d: f"{f[0]}.{l}@{d}",
+    'firstnamelastname@': lambda f, l, d: f"{f}{l}@{d}",
+    'firstname_lastname@': lambda f, l, d: f"{f}_{l}@{d}",
+    'firstinitiallastname@': lambda f, l, d: f"{f[0]}{l}@{d}",
+    'lastname.firstname@': lambda f, l, d: f"{l}.{f}@{d}",
+    'lastnameonly@': lambda f, l, d: f"{l}@{d}",
+}
+_FORMAT_BUILDERS['f.lastname@'] = _FORMAT_BUILDERS['firstinitial.lastname@']
+
+# Formats tried when no company-specific format can be found
+_FALLBACK_FORMATS = (
+    'firstinitiallastname@',  # jsmith@company.com
+    'firstname.lastname@',    # john.smith@company.com
+    'firstname@',             # john@company.com
+    'firstnamelastname@',     # johnsmith@company.com
+    'firstname_lastname@'     # john_smith@company.com
+)
+
+# Characters dropped from name parts before building local parts (e.g. Mary-Jane O'Neil)
+_NAME_STRIP = str.maketrans('', '', " '-")
+
+# Letters that NFKD doesn't decompose into an ASCII base letter
+_ASCII_LETTERS = str.maketrans({
+    'ø': 'o', 'Ø': 'O', 'æ': 'ae', 'Æ': 'AE', 'œ': 'oe', 'Œ': 'OE', 'ß': 'ss',
+    'ł': 'l', 'Ł': 'L', 'đ': 'd', 'Đ': 'D', 'þ': 'th', 'Þ': 'Th'
+})
+
+def _normalize_name(name: str) -> str:
+    """Turn a name part into local-part form, e.g. "José-María" -> "josemaria"
+    
+    Accents are folded to ASCII, since most mail servers reject non-ASCII local parts.
+    """
+    name = name.translate(_ASCII_LETTERS)
+    folded = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+    return folded.lower().translate(_NAME_STRIP)
+
+# Formats tried, in order, when the company's format isn't recognized
+_COMMON_FORMATS = (
+    'firstinitiallastname@',   # jsmith@company.com
+    'firstname@',              # john@company.com
+    'firstname.lastname@',     # john.smith@company.com
+    'firstname_lastname@',     # john_smith@company.com
+    'firstnamelastname@',      # johnsmith@company.com
+    'firstinitial.lastname@'   # j.smith@company.com
+)
+
+# TLDs probed, in order of preference, when guessing a company's domain from its name
+_DOMAIN_TLDS = ("com", "io", "co", "ai", "org")
+
+# Terminal color for each confidence level in CLI output
+_CONF_COLOR = {"High": Fore.GREEN, "Medium": Fore.YELLOW, "Low": Fore.RED}
+
+# Throwaway-mailbox providers; no one's work address lives there
+_DISPOSABLE_DOMAINS = frozenset({
+    "mailinator.com", "guerrillamail.com", "sharklasers.com", "10minutemail.com", "temp-mail.org",
+    "yopmail.com", "trashmail.com", "getnada.com", "dispostable.com", "maildrop.cc", "throwawaymail.com"
+})
+
+# Free webmail providers don't reveal mailbox existence over SMTP, so probing them yields no signal
+_FREEMAIL_DOMAINS = frozenset({
+    "gmail.com", "googlemail.com", "outlook.com", "hotmail.com", "live.com", "msn.com",
+    "yahoo.com", "ymail.com", "icloud.com", "me.com", "mac.com", "aol.com",
+    "proton.me", "protonmail.com", "gmx.com", "mail.com", "zoho.com", "yandex.com"
+})
+
+_redis_client = None
+
+def _mount_pooled_adapter(session: requests.Session, pool_maxsize: int):
+    """Mount a keep-alive connection pool with retries on an HTTP session
+    
+    Args:
+        session: Session to configure
+        pool_maxsize: Connections kept open per host (requests beyond it still go
+            out, on connections that are closed afterwards)
+    """
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=Retry(total=2, backoff_factor=0.2))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive"
+
+try:
+    _resolver = dns.resolver.Resolver(configure=True)
+except dns.resolver.NoResolverConfiguration:
+    _resolver = None  # No usable system resolver; every lookup goes over DoH
+
+# Shared session so DoH queries reuse a warm TLS connection to the resolver. DoH is
+# only the fallback resolver, used at most once per verification worker at a time
+_doh_session = requests.Session()
+_mount_pooled_adapter(_doh_session, pool_maxsize=8)
+
+# Shared by all EmailFinder instances, so each lookup (e.g. per Flask request)
+# reuses warm connections to the Custom Search API instead of a new TLS handshake
+_search_session = requests.Session()
+# _search_bucket lets at most SEARCH_BURST requests out back to back
+_mount_pooled_adapter(_search_session, pool_maxsize=SEARCH_BURST)
+# The User-Agent is picked per request in _google_custom_search
+_search_session.headers.update({
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Referer': 'https://www.google.com/'
+})
+atexit.register(_search_session.close)
+atexit.register(_doh_session.close)
+
+def _json_loads(data) -> Any:
+    """Decode JSON from bytes or str, using orjson when it's installed"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _json_dumps(value: Any):
+    """Encode a value as JSON (bytes with orjson, str without)"""
+    return orjson.dumps(value) if orjson is not None else json.dumps(value)
+
+def _json_line(value: Any) -> bytes:
+    """Encode a value as one newline-terminated line of JSON"""
+    data = _json_dumps(value)
+    return (data.encode() if isinstance(data, str) else data) + b"\n"
+
+def _get_redis():
+    """Get the Redis client used for cross-process caching
+    
+    Returns:
+        Redis client, or None if REDIS_URL is unset or redis is not installed
+    """
+    global _redis_client
+    if _redis_client is None and redis is not None and os.getenv("REDIS_URL"):
+        _redis_client = redis.Redis.from_url(os.environ["REDIS_URL"])
+    return _redis_client
+
+def _shared_cache_get(key: str) -> Any:
+    """Read a JSON value from the shared cache
+    
+    Args:
+        key: Cache key
+        
+    Returns:
+        Cached value or None on a miss or when no shared cache is configured
+    """
+    client = _get_redis()
+    if client is None:
+        return None
+    try:
+        value = client.get(key)
+    except redis.RedisError:
+        return None
+    return _json_loads(value) if value is not None else None
+
+def _shared_cache_set(key: str, value: Any, ttl: int):
+    """Write a JSON value to the shared cache
+    
+    Args:
+        key: Cache key
+        value: JSON-serializable value
+        ttl: Time to live in seconds
+    """
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        client.setex(key, ttl, _json_dumps(value))
+    except redis.RedisError:
+        pass
+
+class TTLCache:
+    """Thread-safe in-process cache with expiring entries
+    
+    Entries are mirrored to the shared Redis cache (when configured) under
+    `prefix`, so other processes can reuse them.
+    """
+    
+    def __init__(self, prefix: str, ttl: int, max_entries: int = 4096):
+        """Initialize the cache
+        
+        Args:
+            prefix: Key prefix used in the shared cache
+            ttl: Default time to live in seconds
+            max_entries: Local entries kept before expired (then oldest) ones are dropped
+        """
+        self.prefix = prefix
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = {}  # key -> (expiry, value)
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Any:
+        """Get a cached value
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached value or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        
+        value = _shared_cache_get(self.prefix + key)
+        if value is not None:
+            with self._lock:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+        return value
+    
+    def set(self, key: str, value: Any, ttl: int = None):
+        """Cache a value
+        
+        Args:
+            key: Cache key
+            value: JSON-serializable value (None is not cached)
+            ttl: Time to live in seconds (defaults to the cache's ttl)
+        """
+        if value is None:
+            return
+        ttl = ttl or self.ttl
+        with self._lock:
+            now = time.monotonic()
+            if len(self._entries) >= self.max_entries and key not in self._entries:
+                self._evict(now)
+            self._entries[key] = (now + ttl, value)
+        _shared_cache_set(self.prefix + key, value, ttl)
+    
+    def _evict(self, now: float):
+        """Drop expired entries, or the oldest quarter if none have expired (lock held)"""
+        expired = [key for key, (expiry, _) in self._entries.items() if expiry <= now]
+        if not expired:
+            expired = list(self._entries)[:max(1, self.max_entries // 4)]
+        for key in expired:
+            del self._entries[key]
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter
+    
+    Concurrent callers share one budget of `rate` acquisitions per second,
+    with up to `burst` allowed back to back.
+    """
+    
+    def __init__(self, rate: float, burst: int):
+        """Initialize the bucket
+        
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of stored tokens
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take a token, sleeping until one is available"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Going negative reserves a future token, so waiters are served in order
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+class SingleFlight:
+    """Coalesces concurrent calls for the same key
+    
+    While a call for a key is running, other threads asking for the same key
+    wait for its result instead of repeating the work.
+    """
+    
+    def __init__(self):
+        """Initialize the call registry"""
+        self._calls = {}  # key -> Future of the running call
+        self._lock = threading.Lock()
+    
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run fn once for all concurrent callers with the same key
+        
+        Args:
+            key: Key identifying the call
+            fn: Function to run if no call for key is in flight
+            
+        Returns:
+            Result of fn (exceptions are re-raised in every waiting caller)
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result()
+        
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+class DiskCache:
+    """On-disk cache shared by all runs on the machine
+    
+    Backed by SQLite, so repeated CLI runs skip Custom Search calls and DNS
+    lookups already answered by an earlier run. The database is opened on
+    first use; if it can't be opened or written, lookups quietly miss.
+    Entries older than the longest TTL read so far are deleted when the
+    database is opened and every DISK_CACHE_PRUNE_EVERY writes after that.
+    """
+    
+    def __init__(self, path: str, max_age: int):
+        """Initialize the cache
+        
+        Args:
+            path: Path of the SQLite database file
+            max_age: Seconds after which an entry is deleted, unless a longer TTL is read
+        """
+        self.path = path
+        self.max_age = max_age
+        self._conn = None
+        self._disabled = False
+        self._writes = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key: str, ttl: int) -> Any:
+        """Get a cached value
+        
+        Args:
+            key: Cache key
+            ttl: Maximum age in seconds
+            
+        Returns:
+            Decoded value or None if missing or older than ttl
+        """
+        entry = self.get_entry(key, ttl)
+        return entry[0] if entry else None
+    
+    def get_entry(self, key: str, ttl: int) -> Optional[Tuple[Any, float]]:
+        """Get a cached value along with its age
+        
+        Args:
+            key: Cache key
+            ttl: Maximum age in seconds
+            
+        Returns:
+            Tuple of (decoded value, age in seconds), or None if missing or older than ttl
+        """
+        now = time.time()
+        with self._lock:
+            self.max_age = max(self.max_age, ttl)
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute("SELECT json, ts FROM entries WHERE key = ? AND ts > ?",
+                                   (key, int(now) - ttl)).fetchone()
+            except sqlite3.Error:
+                return None
+        return (_json_loads(row[0]), max(0.0, now - row[1])) if row else None
+    
+    def set(self, key: str, value: Any):
+        """Cache a value
+        
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+        """
+        data = _json_dumps(value)
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.execute("INSERT OR REPLACE INTO entries (key, ts, json) VALUES (?, ?, ?)",
+                                 (key, int(time.time()), data))
+            except sqlite3.Error:
+                return
+            self._writes += 1
+            if self._writes % DISK_CACHE_PRUNE_EVERY == 0:
+                self._prune(conn)
+    
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database and create the table on first use (lock held)"""
+        if self._conn is None and not self._disabled:
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+                conn.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, ts INTEGER, json BLOB)")
+                self._conn = conn
+            except (OSError, sqlite3.Error) as e:
+                logger.debug("Disk cache unavailable at %s: %s", self.path, e)
+                self._disabled = True
+            else:
+                self._prune(conn)
+        return self._conn
+    
+    def _prune(self, conn: sqlite3.Connection):
+        """Delete entries no lookup can use any more (lock held)"""
+        try:
+            with conn:
+                conn.execute("DELETE FROM entries WHERE ts <= ?", (int(time.time()) - self.max_age,))
+        except sqlite3.Error as e:
+            logger.debug("Could not prune the disk cache at %s: %s", self.path, e)
+
+# Custom Search responses and dead domains persisted across runs
+_disk_cache = DiskCache(DISK_CACHE_PATH, max(SEARCH_CACHE_TTL, DNS_MISS_TTL))
+
+# Custom Search quota is per API key, not per EmailFinder, so all instances share one budget
+_search_bucket = TokenBucket(SEARCH_RATE, SEARCH_BURST)
+
+# Email formats discovered per company domain
+_format_cache = TTLCache("email_fmt:", FORMAT_CACHE_TTL)
+
+# Domains discovered per normalized company name
+_domain_cache = TTLCache("company_domain:", DOMAIN_CACHE_TTL)
+
+# Searches in flight, so concurrent lookups for one company share the API calls
+_format_flight = SingleFlight()
+_domain_flight = SingleFlight()
+
+# Whether a domain's mail server accepts any recipient
+_catch_all_cache = TTLCache("catch_all:", CATCH_ALL_TTL)
+
+# DNS answers per domain
+_mx_cache = TTLCache("dns:mx:", DNS_CACHE_TTL)
+_a_cache = TTLCache("dns:a:", DNS_CACHE_TTL)
+
+# Mail servers pace per client, not per EmailFinder, so all instances share one schedule:
+# the next time an SMTP session may start and the current spacing, per MX host
+_mx_next_slot = {}
+_mx_gap = {}  # Widened while a host tempfails
+_mx_next_slot_lock = threading.Lock()
+
+def _doh_answers(name: str, record_type: str) -> List[str]:
+    """Query DNS-over-HTTPS for records of a given type
+    
+    Args:
+        name: Domain name to resolve
+        record_type: Record type ("A" or "MX")
+        
+    Returns:
+        List of record data strings (empty if the name has no such records)
+        
+    Raises:
+        dns.exception.DNSException: If the resolver couldn't answer (e.g. SERVFAIL),
+            so the failure isn't cached as "no records"
+    """
+    response = _doh_session.get(DOH_URL, params={"name": name, "type": record_type}, timeout=5)
+    response.raise_for_status()
+    result = _json_loads(response.content)
+    status = result.get('Status')
+    if status not in DOH_DEFINITIVE_STATUS:
+        raise dns.exception.DNSException(f"DoH lookup of {record_type} {name} failed with status {status}")
+    type_code = DNS_RECORD_TYPES[record_type]
+    return [answer['data'] for answer in result.get('Answer', []) if answer.get('type') == type_code]
+
+def _dns_records(name: str, record_type: str) -> List[str]:
+    """Look up DNS records with the system resolver, falling back to DNS-over-HTTPS
+    
+    Args:
+        name: Domain name to resolve
+        record_type: Record type ("A" or "MX")
+        
+    Returns:
+        List of record data strings (empty if the name has no such records)
+    """
+    if _resolver is None:
+        return _doh_answers(name, record_type)
+    
+    try:
+        answers = _resolver.resolve(name, record_type, lifetime=5)
+        return [answer.to_text() for answer in answers]
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+        return []
+    except dns.exception.DNSException:
+        # e.g. timeouts, or a local resolver that refuses MX queries
+        return _doh_answers(name, record_type)
+
+# getaddrinfo errors that mean the name has no addresses, as opposed to a resolver failure
+_GAI_NO_ADDRESS = frozenset(
+    code for code in (socket.EAI_NONAME, getattr(socket, "EAI_NODATA", None)) if code is not None
+)
+
+def _system_addresses(domain: str) -> Tuple[str, ...]:
+    """Resolve IPv4 addresses through the OS resolver, falling back to DNS lookups
+    
+    getaddrinfo answers from /etc/hosts and any local caching resolver without
+    a network round trip; if the OS resolver itself fails, the query goes
+    through _dns_records instead.
+    
+    Args:
+        domain: Domain to resolve
+        
+    Returns:
+        Tuple of addresses (empty if the domain has no addresses)
+    """
+    try:
+        infos = socket.getaddrinfo(domain, None, socket.AF_INET, socket.SOCK_STREAM)
+    except socket.gaierror as e:
+        if e.errno in _GAI_NO_ADDRESS:
+            return ()
+        return tuple(_dns_records(domain, "A"))
+    except UnicodeError:
+        # Labels the IDNA codec rejects (e.g. over 63 characters) can't exist
+        return ()
+    return tuple(dict.fromkeys(info[4][0] for info in infos))
+
+def _resolve_mx(domain: str) -> Tuple[str, ...]:
+    """Resolve the mail exchangers for a domain
+    
+    Answers are cached in memory and on disk, so later runs verifying the
+    same domains skip the lookup. Lookup failures raise instead of
+    returning, so they are never cached.
+    
+    Args:
+        domain: Domain to resolve
+        
+    Returns:
+        Tuple of MX hostnames ordered by preference (empty if the domain has no MX records)
+    """
+    cached = _mx_cache.get(domain)
+    if cached is None:
+        # Answers from earlier runs skip the lookup; domains without MX records
+        # are remembered for DNS_MISS_TTL, mail servers for DNS_CACHE_TTL
+        entry = _disk_cache.get_entry("dns:mx:" + domain, DNS_MISS_TTL)
+        if entry is not None:
+            hosts, age = entry
+            remaining = (DNS_CACHE_TTL if hosts else DNS_MISS_TTL) - age
+            if remaining >= 1:
+                # Kept in memory only for what's left of the disk entry's lifetime
+                cached = hosts
+                _mx_cache.set(domain, cached, int(remaining))
+    if cached is not None:
+        return tuple(cached)
+    
+    records = []
+    for data in _dns_records(domain, "MX"):
+        # MX record format is "priority domain"
+        priority, host = data.split(' ', 1)
+        records.append((int(priority), host.rstrip('.')))
+    hosts = tuple(host for _, host in sorted(records))
+    
+    _mx_cache.set(domain, hosts)
+    _disk_cache.set("dns:mx:" + domain, hosts)
+    return hosts
+
+def _resolve_a(domain: str) -> Tuple[str, ...]:
+    """Resolve the IPv4 addresses for a domain
+    
+    Lookup failures raise instead of returning, so they are never cached.
+    
+    Args:
+        domain: Domain to resolve
+        
+    Returns:
+        Tuple of addresses (empty if the domain has no A records)
+    """
+    cached = _a_cache.get(domain)
+    if cached is None:
+        # Guessed domains (e.g. company.io) an earlier run found dead skip the lookup
+        entry = _disk_cache.get_entry("dns:a:" + domain, DNS_MISS_TTL)
+        if entry is not None and DNS_MISS_TTL - entry[1] >= 1:
+            cached = entry[0]
+            _a_cache.set(domain, cached, int(DNS_MISS_TTL - entry[1]))
+    if cached is not None:
+        return tuple(cached)
+    
+    addresses = _system_addresses(domain)
+    
+    _a_cache.set(domain, addresses)
+    if not addresses:
+        _disk_cache.set("dns:a:" + domain, addresses)
+    return addresses
+
+def _has_a_record(domain: str) -> bool:
+    """Check whether a domain resolves, treating lookup errors as no"""
+    try:
+        return bool(_resolve_a(domain))
+    except Exception:
+        return False
+
+def _first_live_domain(domains: List[str]) -> Optional[str]:
+    """Probe domains concurrently and pick the most preferred one that resolves
+    
+    Args:
+        domains: Candidate domains, most preferred first
+        
+    Returns:
+        First domain in the given order that has an A record, or None
+    """
+    if not domains:
+        return None
+    
+    executor = ThreadPoolExecutor(max_workers=len(domains))
+    try:
+        futures = [executor.submit(_has_a_record, domain) for domain in domains]
+        for domain, future in zip(domains, futures):
+            if future.result():
+                return domain
+        return None
+    finally:
+        # Don't wait on lower-preference probes once an answer is known
+        executor.shutdown(wait=False, cancel_futures=True)
+
+class _SmtpProbeError(Exception):
+    """Raised when an SMTP probe session can't continue; the message is the reason"""
+
+class _SmtpProbe:
+    """SMTP session for checking recipients without sending mail
+    
+    The connection and HELO happen once on enter; each check() then runs
+    MAIL FROM/RCPT TO/RSET on the same session, so every candidate on a
+    domain shares one handshake.
+    """
+    
+    def __init__(self, mx_hosts: Tuple[str, ...], domain: str, timeout: float = 10,
+                 connect_timeout: float = 3, connect_deadline: float = 8, require_tls: bool = False):
+        """Initialize the probe
+        
+        Args:
+            mx_hosts: Mail servers to try, most preferred first
+            domain: Domain being verified (used as a last-resort host and for the sender)
+            timeout: Socket timeout in seconds once connected
+            connect_timeout: Seconds allowed for each connection attempt
+            connect_deadline: Seconds allowed for trying all hosts
+            require_tls: Upgrade with STARTTLS, failing if the server doesn't offer it
+        """
+        self.mx_hosts = mx_hosts
+        self.domain = domain
+        self.sender = f"verify@{domain}"  # Use the same domain
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.connect_deadline = connect_deadline
+        self.require_tls = require_tls
+        self.smtp = None
+    
+    def __enter__(self):
+        self._connect()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._quit()
+        return False
+    
+    def _connect(self):
+        """Open the session: connect, HELO, and STARTTLS when offered"""
+        # Connect to the SMTP server
+        self.smtp = smtplib.SMTP(timeout=self.timeout)
+        self.smtp.set_debuglevel(0)  # Set to 1 for debugging
+        
+        # Try each MX server in preference order, then the domain itself,
+        # without letting dead hosts add up past the deadline
+        deadline = time.monotonic() + self.connect_deadline
+        connected = False
+        for host in dict.fromkeys((*self.mx_hosts, self.domain)):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self.smtp.timeout = min(self.connect_timeout, remaining)
+            try:
+                self.smtp.connect(host, 25)
+            except OSError:
+                self.smtp.close()
+                continue
+            connected = True
+            break
+        if not connected:
+            raise _SmtpProbeError("Connection failed")
+        self.smtp.sock.settimeout(self.timeout)
+        
+        # Say hello to the server; EHLO is only needed to discover STARTTLS
+        try:
+            if self.require_tls:
+                self.smtp.ehlo()
+            else:
+                self.smtp.helo()
+        except Exception:
+            self._quit()
+            raise _SmtpProbeError("HELO failed")
+        
+        # RCPT TO is answered the same without TLS, so only upgrade when asked to
+        if self.require_tls:
+            try:
+                self.smtp.starttls()
+                self.smtp.ehlo()
+            except Exception:
+                self._quit()
+                raise _SmtpProbeError("STARTTLS failed")
+    
+    def check(self, email: str) -> int:
+        """Probe a single recipient
+        
+        Servers often drop a session after a number of recipients; if that
+        happens the session is reopened once and the recipient retried.
+        
+        Args:
+            email: Email address to probe
+            
+        Returns:
+            RCPT TO response code
+        """
+        try:
+            return self._check(email)
+        except smtplib.SMTPServerDisconnected:
+            self._quit()
+            self._connect()
+            return self._check(email)
+    
+    def accepts_any(self) -> Optional[bool]:
+        """Check whether the server accepts any recipient (a catch-all domain)
+        
+        Returns:
+            True if a random, almost certainly nonexistent address is accepted,
+            False if it is rejected, or None if the server gave no definite
+            answer (e.g. a 4xx while greylisting)
+        """
+        code = self.check(f"nx-{uuid.uuid4().hex[:12]}@{self.domain}")
+        if code == 250:
+            return True
+        if code == 550:
+            return False
+        return None
+    
+    def _check(self, email: str) -> int:
+        """Run one MAIL FROM/RCPT TO/RSET transaction on the open session"""
+        # MAIL FROM
+        try:
+            self.smtp.mail(self.sender)
+        except smtplib.SMTPServerDisconnected:
+            raise
+        except Exception:
+            raise _SmtpProbeError("MAIL FROM failed")
+        
+        try:
+            code, message = self.smtp.rcpt(email)
+        finally:
+            # Reset the transaction before probing the next recipient
+            try:
+                self.smtp.rset()
+            except Exception:
+                pass
+        return code
+    
+    def _quit(self):
+        """Close the session, ignoring errors from an already-dropped connection"""
+        try:
+            self.smtp.quit()
+        except Exception:
+            pass
+
+def _build_chrome_options(headless: bool, user_agent: str) -> "Options":
+    """Build the Chrome options for a driver
+    
+    Args:
+        headless: Whether to run Chrome headless
+        user_agent: User agent string
+        
+    Returns:
+        Chrome Options
+    """
+    from selenium.webdriver.chrome.options import Options
+    
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless=new")
+    
+    chrome_options.add_argument(f"user-agent={user_agent}")
+    
+    # Add standard options
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-notifications")
+    chrome_options.add_argument("--disable-infobars")
+    chrome_options.add_argument("--disable-extensions")
+    return chrome_options
+
+def _merge_config(defaults: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge a user configuration into the defaults
+    
+    Nested sections are merged key by key, so a config file that only sets
+    e.g. "verification": {"max_workers": 4} keeps the other verification
+    defaults; any other value replaces the default.
+    
+    Args:
+        defaults: Default configuration (not modified)
+        overrides: Configuration loaded from the user's file
+        
+    Returns:
+        New configuration dictionary
+    """
+    merged = copy.deepcopy(defaults)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge_config(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
 class EmailFinder:
     """Main class for finding emails based on name and company information"""
     
@@ -52,14 +919,16 @@ class EmailFinder:
             "lastnameonly@": ["last@", "lastname only"]
         },
         "default_email_format": "firstname.lastname@",
-        "delays": {
-            "between_requests": [1.0, 3.0],  # Random delay between min and max seconds
-            "after_captcha": [5.0, 10.0]     # Longer delay after handling CAPTCHA
-        },
         "retries": {
             "max_attempts": 3,
             "backoff_factor": 2.0
         },
+        "verification": {
+            "max_workers": 8,   # Domains verified concurrently (one SMTP session each)
+            "min_gap": 0.5,     # Minimum seconds between SMTP sessions to the same MX host
+            "max_gap": 30.0,    # Upper bound on the gap after repeated temporary failures (4xx)
+            "require_tls": False  # Probe only over STARTTLS (one more round trip per session)
+        },
         "google_search": {
             "api_key": os.getenv("GOOGLE_API_KEY", ""),
             "search_engine_id": os.getenv("GOOGLE_SEARCH_ENGINE_ID", ""),
@@ -67,7 +936,8 @@ class EmailFinder:
         }
     }
     
-    def __init__(self, headless: bool = True, config_path: str = None, api_key: str = None, search_engine_id: str = None):
+    def __init__(self, headless: bool = True, config_path: str = None, api_key: str = None, search_engine_id: str = None,
+                 search_cache_ttl: int = SEARCH_CACHE_TTL):
         """Initialize the Email Finder
         
         Args:
@@ -75,14 +945,18 @@ class EmailFinder:
             config_path: Path to configuration file (JSON)
             api_key: Google Custom Search API key (overrides env variable and config)
             search_engine_id: Google Custom Search Engine ID (overrides env variable and config)
+            search_cache_ttl: Seconds Custom Search responses are reused from the on-disk cache (0 disables it)
         """
         # Load configuration
-        self.config = self.DEFAULT_CONFIG.copy()
+        # A deep copy, so overriding the API key below doesn't change the class defaults
+        self.config = copy.deepcopy(self.DEFAULT_CONFIG)
         if config_path and os.path.exists(config_path):
             try:
-                with open(config_path, 'r') as f:
-                    user_config = json.load(f)
-                    self.config.update(user_config)
+                with open(config_path, 'rb') as f:
+                    user_config = _json_loads(f.read())
+                if not isinstance(user_config, dict):
+                    raise ValueError("expected a JSON object")
+                self.config = _merge_config(self.DEFAULT_CONFIG, user_config)
             except Exception as e:
                 print(f"{Fore.YELLOW}[!] Error loading config file: {str(e)}, using defaults{Style.RESET_ALL}")
         
@@ -101,33 +975,36 @@ class EmailFinder:
         self.headless = headless
         self.driver = None
         
+        self.search_cache_ttl = search_cache_ttl
+        
+        # Frozen once so per-request User-Agent picks don't go through the config dict
+        self._user_agents = tuple(self.config['user_agents'])
+        
+        # Map each format description found in search snippets to its format name
+        self._pattern_to_format = {}
+        for format_name, patterns in self.config["email_formats"].items():
+            for pattern in patterns:
+                self._pattern_to_format.setdefault(pattern, format_name)
+        
+        # One scan finds every pattern occurrence; the lookahead lets matches overlap
+        # so the earliest-listed pattern still wins, as with a linear search
+        self._pattern_rank = {pattern: rank for rank, pattern in enumerate(self._pattern_to_format)}
+        self._format_re = re.compile(
+            "(?=(" + "|".join(re.escape(pattern) for pattern in self._pattern_to_format) + "))"
+        ) if self._pattern_to_format else None
+        
         # We'll still keep a requests session for API calls and simple operations
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': random.choice(self.config['user_agents']),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Referer': 'https://www.google.com/'
-        })
+        self.session = _search_session
         
     def _initialize_driver(self):
         """Initialize the Selenium WebDriver (used as fallback)"""
         if self.driver is not None:
             return
-            
-        chrome_options = Options()
-        if self.headless:
-            chrome_options.add_argument("--headless=new")
         
         # Set a random user agent
-        chrome_options.add_argument(f"user-agent={random.choice(self.config['user_agents'])}")
+        chrome_options = _build_chrome_options(self.headless, random.choice(self._user_agents))
         
-        # Add standard options
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-infobars")
-        chrome_options.add_argument("--disable-extensions")
+        from selenium import webdriver
         
         try:
             # Try using the system Chrome directly
@@ -143,18 +1020,50 @@ class EmailFinder:
             self.driver.quit()
             self.driver = None
     
-    def _random_delay(self, delay_type="between_requests"):
-        """Add a random delay to avoid rate limiting
+    def _throttle_mx(self, mx_host: str):
+        """Wait until an SMTP session to an MX host is allowed to start
+        
+        Sessions to the same host are spaced at least `min_gap` seconds apart,
+        or longer while the host is answering with temporary failures; the
+        first session to a host starts immediately.
+        
+        Args:
+            mx_host: Hostname of the mail server
+        """
+        min_gap = self.config["verification"]["min_gap"]
+        with _mx_next_slot_lock:
+            now = time.monotonic()
+            start = max(now, _mx_next_slot.get(mx_host, now))
+            _mx_next_slot[mx_host] = start + _mx_gap.get(mx_host, min_gap)
+        
+        if start > now:
+            time.sleep(start - now)
+    
+    def _record_mx_response(self, mx_host: str, code: int):
+        """Adapt the spacing for an MX host to its latest RCPT response
+        
+        A temporary failure (4xx) doubles the gap up to `max_gap`; a definite
+        answer halves it back towards `min_gap`.
         
         Args:
-            delay_type: Type of delay from config
+            mx_host: Hostname of the mail server
+            code: RCPT TO response code
         """
-        min_delay, max_delay = self.config["delays"][delay_type]
-        time.sleep(random.uniform(min_delay, max_delay))
+        min_gap = self.config["verification"]["min_gap"]
+        max_gap = self.config["verification"]["max_gap"]
+        with _mx_next_slot_lock:
+            gap = _mx_gap.get(mx_host, min_gap)
+            if 400 <= code < 500:
+                _mx_gap[mx_host] = min(max(gap * 2, 1.0), max_gap)
+            elif gap > min_gap:
+                _mx_gap[mx_host] = max(gap / 2, min_gap)
     
     def _google_custom_search(self, query: str, page: int = 1) -> Dict[str, Any]:
         """Perform a Google Custom Search using the API
         
+        Successful responses are reused from the on-disk cache for
+        search_cache_ttl seconds.
+        
         Args:
             query: Search query
             page: Page number (1-based)
@@ -187,14 +1096,38 @@ class EmailFinder:
                 "num": self.config["google_search"]["results_per_page"]
             }
             
+            cache_key = "search:" + hashlib.sha1(f"{query}|{search_engine_id}|{start}".encode()).hexdigest()
+            if self.search_cache_ttl:
+                cached_results = _disk_cache.get(cache_key, self.search_cache_ttl)
+                if cached_results is not None:
+                    print(f"{Fore.GREEN}[+] Using cached search results for: {query}{Style.RESET_ALL}")
+                    return cached_results
+            
             print(f"{Fore.BLUE}[*] Performing Google Custom Search for: {query}{Style.RESET_ALL}")
             
-            # Make the API request
-            response = self.session.get(url, params=params)
+            max_attempts = self.config["retries"]["max_attempts"]
+            for attempt in range(1, max_attempts + 1):
+                _search_bucket.acquire()
+                
+                # Make the API request
+                response = self.session.get(url, params=params,
+                                            headers={'User-Agent': random.choice(self._user_agents)})
+                if response.status_code != 429 or attempt == max_attempts:
+                    break
+                
+                # Rate limited: wait as long as the API asks, or back off exponentially
+                retry_after = response.headers.get("Retry-After", "")
+                delay = int(retry_after) if retry_after.isdigit() else self.config["retries"]["backoff_factor"] ** attempt
+                delay = min(delay, 60)
+                print(f"{Fore.YELLOW}[!] Google Custom Search rate limit hit; retrying in {delay:g}s{Style.RESET_ALL}")
+                time.sleep(delay)
             
             # Check if the request was successful
             if response.status_code == 200:
-                return response.json()
+                search_results = _json_loads(response.content)
+                if self.search_cache_ttl:
+                    _disk_cache.set(cache_key, search_results)
+                return search_results
             else:
                 print(f"{Fore.RED}[!] Google Custom Search API returned status code {response.status_code}{Style.RESET_ALL}")
                 print(f"{Fore.RED}[!] Response: {response.text}{Style.RESET_ALL}")
@@ -226,6 +1159,10 @@ class EmailFinder:
             profile_info['last_name'] = last_name
             profile_info['company'] = company
             
+            # Normalized once here so pattern generation doesn't redo it per call
+            profile_info['_first_lc'] = _normalize_name(first_name)
+            profile_info['_last_lc'] = _normalize_name(last_name)
+            
             # Attempt to determine company domain
             company_domain = self.get_company_domain(company)
             profile_info['company_domain'] = company_domain
@@ -239,157 +1176,201 @@ class EmailFinder:
     def get_company_domain(self, company_name: str) -> Optional[str]:
         """Get the domain for a company using Google Custom Search API
         
+        Results are cached per normalized company name for DOMAIN_CACHE_TTL seconds,
+        and concurrent calls for the same company share one search.
+        
         Args:
             company_name: Name of the company
             
         Returns:
             Company domain or None if not found
         """
+        # Clean company name for search
+        clean_company = " ".join(company_name.lower().split())
+        
+        cached_domain = _domain_cache.get(clean_company)
+        if cached_domain is not None:
+            print(f"{Fore.GREEN}[+] Using cached domain for {company_name}{Style.RESET_ALL}")
+            return cached_domain
+        
         print(f"{Fore.BLUE}[*] Looking up domain for {company_name}...{Style.RESET_ALL}")
         
         try:
-            # Clean company name for search
-            clean_company = company_name.lower().strip()
-            
-            # Try direct approach first - assume company.com
-            domain = f"{clean_company.replace(' ', '')}.com"
-            
-            # Check if domain exists using DNS lookup
-            try:
-                response = requests.get(f"https://dns.google/resolve?name={domain}&type=A", timeout=5)
-                dns_data = response.json()
-                if dns_data.get('Answer'):
-                    return domain
-            except Exception:
-                pass
-            
-            # If direct approach fails, try Google Custom Search API
-            search_query = f"{clean_company} official website"
-            
-            # Try the API search first
-            search_results = self._google_custom_search(search_query)
-            
-            if search_results and 'items' in search_results:
-                # Extract domains from the search results
-                for item in search_results['items'][:3]:  # Check top 3 results
-                    url = item.get('link')
-                    if url:
-                        parsed_url = urlparse(url)
-                        if parsed_url.netloc and '.' in parsed_url.netloc:
-                            domain = parsed_url.netloc
-                            if domain.startswith('www.'):
-                                domain = domain[4:]
-                            return domain
-            
-            # If no domain found, return a default based on company name
-            return f"{clean_company.replace(' ', '')}.com"
-            
+            domain = _domain_flight.do(clean_company, lambda: self._search_company_domain(clean_company))
         except Exception as e:
             print(f"{Fore.RED}[!] Error finding company domain: {str(e)}{Style.RESET_ALL}")
-            return f"{company_name.lower().replace(' ', '')}.com"
+            return f"{clean_company.replace(' ', '')}.com"
+        
+        if domain:
+            _domain_cache.set(clean_company, domain)
+            return domain
+        
+        # If no domain found, return a default based on company name, retrying that sooner
+        domain = f"{clean_company.replace(' ', '')}.com"
+        _domain_cache.set(clean_company, domain, DOMAIN_MISS_TTL)
+        return domain
+    
+    def _search_company_domain(self, clean_company: str) -> Optional[str]:
+        """Search for a company's domain
+        
+        Args:
+            clean_company: Lowercased company name
+            
+        Returns:
+            Company domain or None if not found
+        """
+        # Try direct approach first - probe company.com, company.io, ... concurrently
+        slug = clean_company.replace(' ', '')
+        domain = _first_live_domain([f"{slug}.{tld}" for tld in _DOMAIN_TLDS])
+        if domain:
+            return domain
+        
+        # If direct approach fails, try Google Custom Search API
+        search_query = f"{clean_company} official website"
+        
+        # Try the API search first
+        search_results = self._google_custom_search(search_query)
+        
+        if search_results and 'items' in search_results:
+            # Extract domains from the search results
+            for item in search_results['items'][:3]:  # Check top 3 results
+                url = item.get('link')
+                if url:
+                    parsed_url = urlparse(url)
+                    if parsed_url.netloc and '.' in parsed_url.netloc:
+                        domain = parsed_url.netloc
+                        if domain.startswith('www.'):
+                            domain = domain[4:]
+                        return domain
+        
+        return None
+    
+    def resolve_domains(self, companies: List[str]) -> Dict[str, str]:
+        """Look up the domains for several companies concurrently
+        
+        Args:
+            companies: Company names
+            
+        Returns:
+            Dict mapping each company name to its domain (a guessed <company>.com
+            when none was found, as with get_company_domain)
+        """
+        unique_companies = list(dict.fromkeys(companies))
+        if not unique_companies:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(len(unique_companies), self.config["verification"]["max_workers"])) as executor:
+            domains = executor.map(self.get_company_domain, unique_companies)
+            return dict(zip(unique_companies, domains))
     
     def find_email_format(self, company_domain: str) -> Optional[str]:
         """Find the email format used by a company through Google Custom Search API
         
+        Results are cached per domain for FORMAT_CACHE_TTL seconds, and
+        concurrent calls for the same domain share one search.
+        
         Args:
             company_domain: Domain of the company
             
         Returns:
             Email format pattern or None if not found
         """
+        cached_format = _format_cache.get(company_domain)
+        if cached_format is not None:
+            print(f"{Fore.GREEN}[+] Using cached email format for {company_domain}{Style.RESET_ALL}")
+            return cached_format
+        
         print(f"{Fore.BLUE}[*] Searching for email format for {company_domain}...{Style.RESET_ALL}")
         
         try:
-            # Extract company name from domain
-            company_name = company_domain.split('.')[0]
+            email_format = _format_flight.do(company_domain, lambda: self._search_email_format(company_domain))
+        except Exception as e:
+            print(f"{Fore.RED}[!] Error finding email format: {str(e)}{Style.RESET_ALL}")
+            # Return the default format from config
+            return self.config["default_email_format"]
+        
+        # A list means the search found nothing specific; retry that sooner
+        ttl = FORMAT_MISS_TTL if isinstance(email_format, list) else FORMAT_CACHE_TTL
+        _format_cache.set(company_domain, email_format, ttl)
+        return email_format
+    
+    def _search_email_format(self, company_domain: str) -> Optional[str]:
+        """Search for the email format used by a company
+        
+        Args:
+            company_domain: Domain of the company
             
-            # Get common formats from config
-            common_formats = self.config["email_formats"]
+        Returns:
+            Email format pattern, or a list of common formats to try if none was found
+        """
+        # Extract company name from domain
+        company_name = company_domain.split('.')[0]
+        
+        # Queries tried in order; the first one is specific enough that only snippets
+        # actually describing an email format are trusted
+        queries = (
+            (f"{company_name} email format pattern leadiq", True),
+            (f"{company_name} company email format", False),
+        )
+        # The second, broader search only runs (and costs quota) if the first finds nothing
+        for search_query, require_phrase in queries:
+            format_name = self._scan_snippets(self._google_custom_search(search_query), require_phrase)
+            if format_name:
+                return format_name
+        
+        # Since we couldn't find a specific format through searches,
+        # try multiple common formats for all companies
+        # This approach is more generic and avoids hardcoding company-specific logic
+        # Return a list of formats to try instead of just one
+        print(f"{Fore.GREEN}[+] Using multiple common email formats for all searches{Style.RESET_ALL}")
+        return list(_FALLBACK_FORMATS)
+    
+    def _scan_snippets(self, search_results: Optional[Dict[str, Any]], require_phrase: bool) -> Optional[str]:
+        """Look for an email format in the snippets of a Custom Search response
+        
+        Args:
+            search_results: Response from _google_custom_search (may be None)
+            require_phrase: Only consider snippets mentioning "email format" or "email pattern"
             
-            # Use a more specific search query that's likely to find email format results
-            search_query = f"{company_name} email format pattern leadiq"
+        Returns:
+            Email format name or None if not found
+        """
+        if not search_results or 'items' not in search_results:
+            return None
+        
+        for item in search_results['items']:
+            snippet = item.get('snippet', '')
+            if not snippet or len(snippet.strip()) <= 20:  # Ignore very short snippets
+                continue
+            logger.debug("Found snippet: %s...", snippet[:100])
             
-            # Try the API search first
-            search_results = self._google_custom_search(search_query)
+            snippet = snippet.lower()
+            if require_phrase and "email format" not in snippet and "email pattern" not in snippet:
+                continue
             
-            if search_results and 'items' in search_results:
-                # Extract snippets from the search results
-                snippets = []
-                
-                for item in search_results['items']:
-                    # Get the snippet
-                    snippet = item.get('snippet', '')
-                    if snippet and len(snippet.strip()) > 20:  # Ignore very short snippets
-                        snippets.append(snippet.lower())
-                        print(f"[+] Found snippet: {snippet[:100]}...")
-                
-                # Look for patterns in snippets
-                for snippet in snippets:
-                    # Check for the typical format description
-                    if "email format" in snippet or "email pattern" in snippet:
-                        # Try to extract the pattern from the snippet
-                        for format_name, patterns in common_formats.items():
-                            for pattern in patterns:
-                                if pattern in snippet:
-                                    print(f"{Fore.GREEN}[+] Found email format: {format_name}{Style.RESET_ALL}")
-                                    return format_name
-                        
-                        # If we found the typical phrase but couldn't identify the pattern,
-                        # check for percentage mentions which often indicate the format
-                        if "%" in snippet:
-                            for format_name, patterns in common_formats.items():
-                                for pattern in patterns:
-                                    if pattern in snippet and re.search(r'\d{2}%', snippet):
-                                        print(f"{Fore.GREEN}[+] Found email format with percentage: {format_name}{Style.RESET_ALL}")
-                                        return format_name
-            
-            # Try a second search with a different query
-            search_query2 = f"{company_name} company email format"
-            search_results2 = self._google_custom_search(search_query2)
-            
-            if search_results2 and 'items' in search_results2:
-                # Extract snippets from the search results
-                snippets = []
-                
-                for item in search_results2['items']:
-                    # Get the snippet
-                    snippet = item.get('snippet', '')
-                    if snippet and len(snippet.strip()) > 20:  # Ignore very short snippets
-                        snippets.append(snippet.lower())
-                
-                # Look for patterns in snippets
-                for snippet in snippets:
-                    for format_name, patterns in common_formats.items():
-                        for pattern in patterns:
-                            if pattern in snippet:
-                                print(f"{Fore.GREEN}[+] Found email format from second search: {format_name}{Style.RESET_ALL}")
-                                return format_name
-            
-            # Since we couldn't find a specific format through searches,
-            # try multiple common formats for all companies
-            # This approach is more generic and avoids hardcoding company-specific logic
-            common_formats_to_try = [
-                'firstinitiallastname@',  # jsmith@company.com
-                'firstname.lastname@',    # john.smith@company.com
-                'firstname@',             # john@company.com
-                'firstnamelastname@',     # johnsmith@company.com
-                'firstname_lastname@'     # john_smith@company.com
-            ]
-            
-            # Return a list of formats to try instead of just one
-            print(f"{Fore.GREEN}[+] Using multiple common email formats for all searches{Style.RESET_ALL}")
-            return common_formats_to_try
-            
-            # We won't reach this code since we're now always returning multiple formats
-            # but keeping it as a fallback just in case
-            default_format = self.config["default_email_format"]
-            print(f"{Fore.YELLOW}[!] No specific email format found, using default format: {default_format}{Style.RESET_ALL}")
-            return default_format
+            format_name = self._match_format(snippet)
+            if format_name:
+                print(f"{Fore.GREEN}[+] Found email format: {format_name}{Style.RESET_ALL}")
+                return format_name
+        
+        return None
+    
+    def _match_format(self, snippet: str) -> Optional[str]:
+        """Identify the email format described in a search snippet
+        
+        Args:
+            snippet: Lowercased snippet text
             
-        except Exception as e:
-            print(f"{Fore.RED}[!] Error finding email format: {str(e)}{Style.RESET_ALL}")
-            # Return the default format from config
-            return self.config["default_email_format"]
+        Returns:
+            Format name of the earliest-listed pattern found, or None
+        """
+        if self._format_re is None:
+            return None
+        
+        found = [match.group(1) for match in self._format_re.finditer(snippet)]
+        if not found:
+            return None
+        return self._pattern_to_format[min(found, key=self._pattern_rank.__getitem__)]
     
     def generate_email_patterns(self, profile_info: Dict[str, Any], domains: List[str] = None) -> List[str]:
         """Generate possible email patterns based on profile information
@@ -404,9 +1385,13 @@ class EmailFinder:
         if not profile_info.get('name'):
             return []
             
-        # Get name components
-        first_name = profile_info.get('first_name', '').lower()
-        last_name = profile_info.get('last_name', '').lower()
+        # Get name components, normalized by extract_profile_info when it built the profile
+        first_name = profile_info.get('_first_lc')
+        if first_name is None:
+            first_name = _normalize_name(profile_info.get('first_name', ''))
+        last_name = profile_info.get('_last_lc')
+        if last_name is None:
+            last_name = _normalize_name(profile_info.get('last_name', ''))
         
         if not first_name or not last_name:
             # Split the name into first and last name if not provided separately
@@ -414,8 +1399,14 @@ class EmailFinder:
             if len(name_parts) < 2:
                 return []
                 
-            first_name = name_parts[0].lower()
-            last_name = name_parts[-1].lower()
+            first_name = _normalize_name(name_parts[0])
+            last_name = _normalize_name(name_parts[-1])
+        
+        # Folding to ASCII leaves nothing of names in non-Latin scripts (e.g. "Иван")
+        if not first_name or not last_name:
+            print(f"{Fore.YELLOW}[!] Can't build email addresses for {profile_info['name']}: "
+                  f"the name has no Latin letters{Style.RESET_ALL}")
+            return []
         
         # Initialize patterns list
         patterns = []
@@ -427,81 +1418,63 @@ class EmailFinder:
             # Try to find the email format used by the company
             email_format = self.find_email_format(company_domain)
             
-            # Handle the case where multiple formats are returned (for specific companies)
-            if isinstance(email_format, list):
-                for format_type in email_format:
-                    if format_type == 'firstname@':
-                        patterns.append(f"{first_name}@{company_domain}")
-                    elif format_type == 'firstname.lastname@':
-                        patterns.append(f"{first_name}.{last_name}@{company_domain}")
-                    elif format_type == 'firstinitial.lastname@' or format_type == 'f.lastname@':
-                        patterns.append(f"{first_name[0]}.{last_name}@{company_domain}")
-                    elif format_type == 'firstnamelastname@':
-                        patterns.append(f"{first_name}{last_name}@{company_domain}")
-                    elif format_type == 'firstname_lastname@':
-                        patterns.append(f"{first_name}_{last_name}@{company_domain}")
-                    elif format_type == 'firstinitiallastname@':
-                        patterns.append(f"{first_name[0]}{last_name}@{company_domain}")
-                    elif format_type == 'lastname.firstname@':
-                        patterns.append(f"{last_name}.{first_name}@{company_domain}")
-                    elif format_type == 'lastnameonly@':
-                        patterns.append(f"{last_name}@{company_domain}")
-            # Handle single format case
-            elif email_format:
-                if email_format == 'firstname@':
-                    patterns.append(f"{first_name}@{company_domain}")
-                elif email_format == 'firstname.lastname@':
-                    patterns.append(f"{first_name}.{last_name}@{company_domain}")
-                elif email_format == 'firstinitial.lastname@' or email_format == 'f.lastname@':
-                    patterns.append(f"{first_name[0]}.{last_name}@{company_domain}")
-                elif email_format == 'firstnamelastname@':
-                    patterns.append(f"{first_name}{last_name}@{company_domain}")
-                elif email_format == 'firstname_lastname@':
-                    patterns.append(f"{first_name}_{last_name}@{company_domain}")
-                elif email_format == 'firstinitiallastname@':
-                    patterns.append(f"{first_name[0]}{last_name}@{company_domain}")
-                elif email_format == 'lastname.firstname@':
-                    patterns.append(f"{last_name}.{first_name}@{company_domain}")
-                elif email_format == 'lastnameonly@':
-                    patterns.append(f"{last_name}@{company_domain}")
-                else:
-                    # Default to common patterns if format not recognized
-                    company_patterns = [
-                        f"{first_name[0]}{last_name}@{company_domain}",  # FLast@domain pattern
-                        f"{first_name}@{company_domain}",
-                        f"{first_name}.{last_name}@{company_domain}",
-                        f"{first_name}_{last_name}@{company_domain}",
-                        f"{first_name}{last_name}@{company_domain}",
-                        f"{first_name[0]}.{last_name}@{company_domain}",
-                    ]
-                    patterns.extend(company_patterns)
-            else:
-                # Use common patterns if no specific format found
-                company_patterns = [
-                    f"{first_name[0]}{last_name}@{company_domain}",  # FLast@domain pattern
-                    f"{first_name}@{company_domain}",
-                    f"{first_name}.{last_name}@{company_domain}",
-                    f"{first_name}_{last_name}@{company_domain}",
-                    f"{first_name}{last_name}@{company_domain}",
-                    f"{first_name[0]}.{last_name}@{company_domain}",
-                ]
-                patterns.extend(company_patterns)
+            # A list means several formats should be tried; a single format
+            # that isn't recognized (or no format at all) falls back to the common ones
+            formats = email_format if isinstance(email_format, list) else [email_format]
+            builders = [_FORMAT_BUILDERS[format_type] for format_type in formats if format_type in _FORMAT_BUILDERS]
+            if not builders and not isinstance(email_format, list):
+                builders = [_FORMAT_BUILDERS[format_type] for format_type in _COMMON_FORMATS]
+            
+            patterns.extend(builder(first_name, last_name, company_domain) for builder in builders)
         
         # Add additional domains if provided
         if domains:
+            # Local parts are the same for every domain, so build them once
+            first_initial = first_name[0]
+            local_parts = (
+                f"{first_initial}{last_name}",  # FLast@domain pattern
+                first_name,
+                last_name,
+                f"{first_name}.{last_name}",
+                f"{first_name}_{last_name}",
+                f"{first_name}{last_name}",
+                f"{first_initial}.{last_name}",
+            )
             for domain in domains:
-                domain_patterns = [
-                    f"{first_name[0]}{last_name}@{domain}",  # FLast@domain pattern
-                    f"{first_name}@{domain}",
-                    f"{last_name}@{domain}",
-                    f"{first_name}.{last_name}@{domain}",
-                    f"{first_name}_{last_name}@{domain}",
-                    f"{first_name}{last_name}@{domain}",
-                    f"{first_name[0]}.{last_name}@{domain}",
-                ]
-                patterns.extend(domain_patterns)
-        
-        return patterns
+                patterns.extend(f"{local_part}@{domain}" for local_part in local_parts)
+        
+        # Drop duplicates (e.g. an additional domain equal to the company domain), keeping order
+        return list(dict.fromkeys(patterns))
+    
+    def generate_email_patterns_batch(self, first_names: List[str], last_names: List[str],
+                                      domains: List[str], email_format: str) -> List[str]:
+        """Build one email address per person using a single known format
+        
+        Args:
+            first_names: First names
+            last_names: Last names, parallel to first_names
+            domains: Company domains, parallel to first_names
+            email_format: Format name (e.g. "firstname.lastname@")
+            
+        Returns:
+            Email addresses in input order (None where a name part is empty)
+            
+        Raises:
+            ValueError: If the format is unknown or the lists differ in length
+        """
+        builder = _FORMAT_BUILDERS.get(email_format)
+        if builder is None:
+            raise ValueError(f"Unknown email format: {email_format}")
+        if not len(first_names) == len(last_names) == len(domains):
+            raise ValueError(f"Expected parallel lists, got {len(first_names)} first names, "
+                             f"{len(last_names)} last names and {len(domains)} domains")
+        
+        emails = []
+        for first_name, last_name, domain in zip(first_names, last_names, domains):
+            first_name = _normalize_name(first_name)
+            last_name = _normalize_name(last_name)
+            emails.append(builder(first_name, last_name, domain) if first_name and last_name else None)
+        return emails
     
     def verify_email(self, email: str) -> Tuple[bool, Optional[str]]:
         """Verify if an email exists using various methods
@@ -512,105 +1485,117 @@ class EmailFinder:
         Returns:
             Tuple of (is_valid, confidence)
         """
+        domain = email.rsplit('@', 1)[-1]
+        return self.verify_email_batch(domain, [email])[0]
+    
+    def verify_email_batch(self, domain: str, emails: List[str],
+                           stop_on_high: bool = False) -> List[Tuple[bool, Optional[str]]]:
+        """Verify several emails on the same domain over a single SMTP session
+        
+        SMTP allows probing any number of recipients after one connection and
+        HELO, so candidates sharing a domain only pay for the handshake once.
+        
+        Args:
+            domain: Domain shared by all of the email addresses
+            emails: Email addresses to verify
+            stop_on_high: Stop probing once an address is confirmed; the rest are
+                returned as (False, "Skipped")
+            
+        Returns:
+            List of (is_valid, confidence) tuples in the same order as emails
+        """
+        results = [None] * len(emails)
+        
         # Method 1: Check email format
-        if not re.match(r"[^@]+@[^@]+\.[^@]+", email):
-            return False, "Invalid format"
+        pending = []
+        for index, email in enumerate(emails):
+            if _EMAIL_RE.fullmatch(email):
+                pending.append(index)
+            else:
+                results[index] = (False, "Invalid format")
+        
+        def finish(result: Tuple[bool, Optional[str]]) -> List[Tuple[bool, Optional[str]]]:
+            # Apply a result to every candidate that hasn't been decided yet
+            for index in pending:
+                if results[index] is None:
+                    results[index] = result
+            return results
+        
+        if not pending:
+            return results
+        
+        if domain in _DISPOSABLE_DOMAINS:
+            return finish((False, "Disposable domain"))
+        
+        if domain in _FREEMAIL_DOMAINS:
+            return finish((True, "Low"))
+        
+        # A catch-all server accepts every candidate, so probing them proves nothing
+        catch_all = _catch_all_cache.get(domain)
+        if catch_all:
+            return finish((True, "Low"))
         
         # Method 2: Check if domain has MX records
-        domain = email.split('@')[1]
         try:
-            response = requests.get(f"https://dns.google/resolve?name={domain}&type=MX", timeout=5)
-            mx_data = response.json()
-            if not mx_data.get('Answer'):
-                return False, "No MX records"
-        except Exception:
-            pass  # Continue with other methods
+            mx_hosts = _resolve_mx(domain)
+            if not mx_hosts:
+                return finish((False, "No MX records"))
+        except Exception as e:
+            logger.debug("Error getting MX record for %s: %s", domain, e)
+            mx_hosts = (domain,)  # Fallback to the email domain
         
         # Method 3: Use SMTP verification without sending an email
         try:
-            import socket
-            import smtplib
+            # Space out sessions to the same mail server
+            self._throttle_mx(mx_hosts[0])
             
-            # Get the MX record
-            mx_domain = None
-            try:
-                response = requests.get(f"https://dns.google/resolve?name={domain}&type=MX", timeout=5)
-                mx_data = response.json()
-                if mx_data.get('Answer'):
-                    # Extract the MX domain from the first record
-                    mx_record = mx_data['Answer'][0]['data']
-                    # MX record format is "priority domain", so split and get the domain part
-                    mx_domain = mx_record.split(' ')[1].rstrip('.')
-            except Exception as e:
-                print(f"Error getting MX record: {e}")
-                mx_domain = domain  # Fallback to the email domain
-            
-            if not mx_domain:
-                return False, "No MX domain"
-            
-            # Connect to the SMTP server
-            smtp = smtplib.SMTP(timeout=10)
-            smtp.set_debuglevel(0)  # Set to 1 for debugging
-            
-            # Connect to the MX server
-            try:
-                smtp.connect(mx_domain, 25)
-            except (socket.gaierror, socket.timeout, ConnectionRefusedError):
-                # If connecting to MX fails, try the domain itself
-                try:
-                    smtp.connect(domain, 25)
-                except Exception:
-                    return False, "Connection failed"
-            
-            # Say hello to the server
-            try:
-                smtp.helo()
-            except Exception:
-                smtp.quit()
-                return False, "HELO failed"
-            
-            # Start TLS if supported
-            try:
-                if smtp.has_extn('starttls'):
-                    smtp.starttls()
-                    smtp.helo()
-            except Exception:
-                pass  # Continue without TLS
-            
-            # Set the sender and recipient
-            sender = f"verify@{domain}"  # Use the same domain
-            
-            # MAIL FROM
-            try:
-                smtp.mail(sender)
-            except Exception:
-                smtp.quit()
-                return False, "MAIL FROM failed"
-            
-            # RCPT TO - this checks if the recipient exists
-            try:
-                code, message = smtp.rcpt(email)
-                smtp.quit()
+            with _SmtpProbe(mx_hosts, domain, require_tls=self.config["verification"]["require_tls"]) as probe:
+                if catch_all is None:
+                    catch_all = probe.accepts_any()
+                    # A tempfailed probe says nothing about the domain; ask again next time
+                    if catch_all is not None:
+                        _catch_all_cache.set(domain, catch_all)
+                if catch_all:
+                    # tqdm.write keeps the progress bar intact while verification runs
+                    tqdm.write(f"{Fore.YELLOW}[!] {domain} accepts any recipient; its candidates can't be confirmed{Style.RESET_ALL}")
+                    return finish((True, "Low"))
                 
-                # Check the response code
-                if code == 250:
-                    return True, "High"  # Email exists
-                elif code == 550:
-                    return False, "Invalid"  # Email doesn't exist
-                else:
-                    return True, "Medium"  # Uncertain
-            except Exception:
-                smtp.quit()
-                return True, "Low"  # Assume it might be valid
+                for index in pending:
+                    # RCPT TO - this checks if the recipient exists
+                    try:
+                        code = probe.check(emails[index])
+                    except _SmtpProbeError:
+                        raise
+                    except Exception:
+                        results[index] = (True, "Low")  # Assume it might be valid
+                        continue
+                    
+                    self._record_mx_response(mx_hosts[0], code)
+                    if 400 <= code < 500:
+                        # Greylisted or rate limited; back off before the next recipient
+                        self._throttle_mx(mx_hosts[0])
+                    
+                    # Check the response code
+                    if code == 250:
+                        results[index] = (True, "High")  # Email exists
+                        if stop_on_high:
+                            return finish((False, "Skipped"))
+                    elif code == 550:
+                        results[index] = (False, "Invalid")  # Email doesn't exist
+                    else:
+                        results[index] = (True, "Medium")  # Uncertain
                 
+        except _SmtpProbeError as e:
+            return finish((False, str(e)))
         except Exception as e:
-            print(f"Error in SMTP verification: {e}")
+            logger.debug("Error in SMTP verification for %s: %s", domain, e)
             pass  # Continue with other methods
         
         # For fallback, we'll return a "possible" result
-        return True, "Medium"
+        return finish((True, "Medium"))
     
-    def find_emails(self, first_name: str, last_name: str, company: str, additional_domains: List[str] = None) -> List[Dict[str, Any]]:
+    def find_emails(self, first_name: str, last_name: str, company: str, additional_domains: List[str] = None,
+                    profile_info: Dict[str, Any] = None, stop_on_high: bool = False) -> List[Dict[str, Any]]:
         """Find emails for a person based on their name and company
         
         Args:
@@ -618,15 +1603,53 @@ class EmailFinder:
             last_name: Last name of the person
             company: Company name
             additional_domains: Additional domains to check
+            profile_info: Profile already returned by extract_profile_info (skips extracting it again)
+            stop_on_high: Stop verifying once an address is confirmed by the mail server
             
         Returns:
             List of dictionaries containing email information
         """
+        # Group by confidence in one pass (anything unexpected goes with Low); within a level,
+        # addresses are put back in candidate order rather than the order domains finished in
+        buckets = {'High': [], 'Medium': [], 'Low': []}
+        for rank, email_info in self._iter_ranked_emails(first_name, last_name, company, additional_domains,
+                                                         profile_info, stop_on_high):
+            buckets.get(email_info['confidence'], buckets['Low']).append((rank, email_info))
+        
+        return [email_info for level in ('High', 'Medium', 'Low') for _, email_info in sorted(buckets[level], key=lambda item: item[0])]
+    
+    def iter_emails(self, first_name: str, last_name: str, company: str, additional_domains: List[str] = None,
+                    profile_info: Dict[str, Any] = None, stop_on_high: bool = False) -> Iterator[Dict[str, Any]]:
+        """Find emails for a person, yielding each one as soon as its domain is verified
+        
+        Args:
+            first_name: First name of the person
+            last_name: Last name of the person
+            company: Company name
+            additional_domains: Additional domains to check
+            profile_info: Profile already returned by extract_profile_info (skips extracting it again)
+            stop_on_high: Stop verifying once an address is confirmed by the mail server
+            
+        Yields:
+            Dictionaries containing email information, in completion order
+        """
+        email_infos = self._iter_ranked_emails(first_name, last_name, company, additional_domains, profile_info, stop_on_high)
+        try:
+            for _, email_info in email_infos:
+                yield email_info
+        finally:
+            email_infos.close()
+    
+    def _iter_ranked_emails(self, first_name: str, last_name: str, company: str, additional_domains: List[str] = None,
+                            profile_info: Dict[str, Any] = None,
+                            stop_on_high: bool = False) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Body of iter_emails; also yields each address's position among the candidates"""
         # Extract profile information
-        profile_info = self.extract_profile_info(first_name, last_name, company)
+        if profile_info is None:
+            profile_info = self.extract_profile_info(first_name, last_name, company)
         if not profile_info:
             print(f"{Fore.RED}[!] Could not process profile information{Style.RESET_ALL}")
-            return []
+            return
         
         print(f"{Fore.GREEN}[+] Processing: {profile_info.get('name', 'Unknown')} at {profile_info.get('company', 'Unknown')}{Style.RESET_ALL}")
         print(f"{Fore.GREEN}[+] Company domain: {profile_info.get('company_domain', 'Unknown')}{Style.RESET_ALL}")
@@ -641,68 +1664,348 @@ class EmailFinder:
         # Generate possible email patterns
         possible_emails = self.generate_email_patterns(profile_info, domains)
         
-        # Verify emails
-        verified_emails = []
-        print(f"{Fore.BLUE}[*] Checking {len(possible_emails)} possible email addresses...{Style.RESET_ALL}")
+        # Domains are case-insensitive, so e.g. Acme.com and acme.com candidates are the same mailbox
+        generated = len(possible_emails)
+        possible_emails = list(dict.fromkeys(email.lower() for email in possible_emails))
+        if len(possible_emails) < generated:
+            print(f"{Fore.BLUE}[*] Skipped {generated - len(possible_emails)} of {generated} candidates as duplicates{Style.RESET_ALL}")
         
-        for email in tqdm(possible_emails, desc="Verifying emails"):
-            is_valid, confidence = self.verify_email(email)
-            if is_valid:
-                verified_emails.append({
-                    'email': email,
-                    'confidence': confidence,
-                    'source': 'pattern_matching'
-                })
-            
-            # Add a small delay to avoid rate limiting
-            self._random_delay()
+        # Verify emails, one SMTP session per domain with domains checked concurrently
+        print(f"{Fore.BLUE}[*] Checking {len(possible_emails)} possible email addresses...{Style.RESET_ALL}")
         
-        # Sort by confidence
-        verified_emails.sort(key=lambda x: 0 if x['confidence'] == 'High' else (1 if x['confidence'] == 'Medium' else 2))
+        emails_by_domain = {}
+        for email in possible_emails:
+            emails_by_domain.setdefault(email.rsplit('@', 1)[-1], []).append(email)
+        rank = {email: position for position, email in enumerate(possible_emails)}
         
-        return verified_emails
+        executor = ThreadPoolExecutor(max_workers=self.config["verification"]["max_workers"])
+        try:
+            futures = {
+                executor.submit(self.verify_email_batch, domain, emails, stop_on_high): emails
+                for domain, emails in emails_by_domain.items()
+            }
+            with tqdm(total=len(possible_emails), desc="Verifying emails") as progress:
+                for future in as_completed(futures):
+                    emails = futures[future]
+                    progress.set_postfix_str(emails[0].rsplit('@', 1)[-1], refresh=False)
+                    progress.update(len(emails))
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        tqdm.write(f"{Fore.RED}[!] Error verifying {', '.join(emails)}: {str(e)}{Style.RESET_ALL}")
+                        continue
+                    
+                    confirmed = False
+                    for email, (is_valid, confidence) in zip(emails, results):
+                        if is_valid:
+                            confirmed = confirmed or confidence == 'High'
+                            yield rank[email], {
+                                'email': email,
+                                'confidence': confidence,
+                                'source': 'pattern_matching'
+                            }
+                    
+                    if stop_on_high and confirmed:
+                        tqdm.write(f"{Fore.GREEN}[+] Confirmed an address; skipping the remaining candidates{Style.RESET_ALL}")
+                        return
+        finally:
+            # Don't wait on batches that can no longer change the outcome (or whose
+            # results the caller stopped reading)
+            executor.shutdown(wait=False, cancel_futures=True)
     
     def cleanup(self):
-        """Clean up resources"""
+        """Clean up resources (safe to call more than once)"""
         self._close_driver()
 
-def main():
-    """Main function"""
+def _default_socket_path() -> str:
+    """Per-user daemon socket path: in $XDG_RUNTIME_DIR, or a private directory under the temp dir"""
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "bcon.sock")
+    user = os.getuid() if hasattr(os, "getuid") else os.getenv("USERNAME", "user")
+    return os.path.join(tempfile.gettempdir(), f"bcon-{user}", "bcon.sock")
+
+SOCKET_PATH = os.getenv("BCON_SOCKET") or _default_socket_path()
+
+def _owned_by_current_user(path: str) -> bool:
+    """Check that a file was created by the current user (so its contents can be trusted)"""
+    return not hasattr(os, "getuid") or os.stat(path).st_uid == os.getuid()
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (once per process, so repeated main() calls reuse it)
+    
+    Returns:
+        Argument parser
+    """
     parser = argparse.ArgumentParser(description='Find emails based on name and company')
-    parser.add_argument('--first-name', required=True, help='First name of the person')
-    parser.add_argument('--last-name', required=True, help='Last name of the person')
-    parser.add_argument('--company', required=True, help='Company name')
+    parser.add_argument('--first-name', help='First name of the person')
+    parser.add_argument('--last-name', help='Last name of the person')
+    parser.add_argument('--company', help='Company name')
     parser.add_argument('--domains', nargs='+', help='Additional domains to check')
     parser.add_argument('--no-headless', action='store_true', help='Run browser in visible mode')
     parser.add_argument('--config', help='Path to configuration file (JSON)')
     parser.add_argument('--api-key', help='Google Custom Search API key (overrides env variable)')
+    parser.add_argument('--api-key-file', help='File containing the Google Custom Search API key (e.g. a mounted secret)')
     parser.add_argument('--search-engine-id', help='Google Custom Search Engine ID (overrides env variable)')
-    args = parser.parse_args()
+    parser.add_argument('--stop-on-high', action='store_true', help='Stop verifying once an address is confirmed by the mail server')
+    parser.add_argument('--cache-ttl', type=int, default=SEARCH_CACHE_TTL,
+                        help=f'Seconds to reuse cached Custom Search responses (default: {SEARCH_CACHE_TTL})')
+    parser.add_argument('--no-cache', action='store_true', help='Neither read nor write the on-disk search cache')
+    parser.add_argument('--verbose', action='store_true', help='Log search snippets and SMTP diagnostics')
+    parser.add_argument('--serve', action='store_true',
+                        help='Keep one finder running and answer queries from later runs over a Unix socket')
+    parser.add_argument('--socket', default=SOCKET_PATH,
+                        help=f'Socket used by --serve and by queries sent to it (default: {SOCKET_PATH})')
+    parser.add_argument('--no-daemon', action='store_true', help='Run in-process even if a --serve daemon is running')
+    return parser
+
+class _QueryHandler(socketserver.StreamRequestHandler):
+    """Answers one query on the daemon socket
+    
+    The client sends one JSON object per connection (first_name, last_name,
+    company and optionally domains and stop_on_high) followed by a newline;
+    each address found is sent back as one JSON line as soon as it is
+    verified, and the connection is closed when the search is done.
+    """
+    
+    def handle(self):
+        """Run the query and stream its results"""
+        try:
+            line = self.rfile.readline()
+            if not line.strip():
+                return  # The client connected but decided to run in-process
+            query = _json_loads(line)
+            if not isinstance(query, dict):
+                raise TypeError("expected a JSON object")
+            for field in ("first_name", "last_name", "company"):
+                if not isinstance(query[field], str):
+                    raise TypeError(f"{field} must be a string")
+            domains = query.get("domains")
+            if domains is not None and not (isinstance(domains, list) and all(isinstance(d, str) for d in domains)):
+                raise TypeError("domains must be a list of strings")
+            email_infos = self.server.finder.iter_emails(
+                query["first_name"], query["last_name"], query["company"], domains,
+                stop_on_high=bool(query.get("stop_on_high"))
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_error(f"Invalid query: {e}")
+            return
+        
+        try:
+            with self.server.slots:
+                for email_info in email_infos:
+                    self._send(email_info)
+        except OSError:
+            pass  # The client went away; closing the generator abandons the rest
+        except Exception as e:
+            self._send_error(str(e))
+    
+    def _send(self, message: Dict[str, Any]):
+        """Write one JSON line to the client"""
+        self.wfile.write(_json_line(message))
+    
+    def _send_error(self, error: str):
+        """Tell the client why the query failed, unless it has already gone away"""
+        try:
+            self._send({"error": error})
+        except OSError:
+            pass
+
+def serve(finder: "EmailFinder", socket_path: str = SOCKET_PATH):
+    """Answer queries from other runs over a Unix socket until interrupted
+    
+    Keeping one finder alive means later queries reuse its warm HTTP
+    connections and in-memory caches instead of paying the start-up cost of
+    a new process.
+    
+    Args:
+        finder: EmailFinder used for every query
+        socket_path: Path of the Unix socket to listen on
+    """
+    # The socket's directory must be private, or another local user could
+    # replace the socket and answer this user's queries
+    socket_dir = os.path.dirname(os.path.abspath(socket_path))
+    os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+    if not _owned_by_current_user(socket_dir) or os.stat(socket_dir).st_mode & 0o022:
+        raise RuntimeError(f"{socket_dir} must be owned by you and not writable by others")
+    
+    conn = _connect_daemon(socket_path)
+    if conn is not None:
+        conn.close()
+        raise RuntimeError(f"A daemon is already listening on {socket_path}")
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)  # Left behind by a daemon that didn't shut down cleanly
+    
+    # Only the current user may send queries
+    umask = os.umask(0o177)
+    try:
+        server = socketserver.ThreadingUnixStreamServer(socket_path, _QueryHandler)
+    finally:
+        os.umask(umask)
+    server.daemon_threads = True
+    server.finder = finder
+    server.slots = threading.BoundedSemaphore(SERVE_MAX_QUERIES)
+    
+    print(f"{Fore.GREEN}[+] Serving queries on {socket_path}{Style.RESET_ALL}")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        try:
+            os.unlink(socket_path)
+        except OSError:
+            pass
+
+def _connect_daemon(socket_path: str) -> Optional[socket.socket]:
+    """Connect to a running --serve daemon
+    
+    Args:
+        socket_path: Path of the daemon's Unix socket
+        
+    Returns:
+        Connected socket, or None if no daemon (run by the current user) is listening
+    """
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
+    if not _owned_by_current_user(socket_path):
+        print(f"{Fore.YELLOW}[!] Ignoring {socket_path}: it belongs to another user{Style.RESET_ALL}")
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+def _query_daemon(sock: socket.socket, query: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Send a query to a daemon and yield the addresses it streams back
+    
+    Args:
+        sock: Socket returned by _connect_daemon
+        query: Query fields (see _QueryHandler)
+        
+    Yields:
+        Dictionaries containing email information
+    """
+    with sock, sock.makefile('rb') as replies:
+        sock.sendall(_json_line(query))
+        for line in replies:
+            message = _json_loads(line)
+            if "error" in message:
+                raise RuntimeError(f"Daemon error: {message['error']}")
+            yield message
+
+def _print_results(email_infos: Iterator[Dict[str, Any]]):
+    """Print each address as it arrives, then a summary
+    
+    Args:
+        email_infos: Dictionaries containing email information
+    """
+    found = 0
+    for found, email_info in enumerate(email_infos, 1):
+        # tqdm.write keeps the line clear of the progress bar
+        tqdm.write(f"{found}. {email_info['email']} - Confidence: "
+                   f"{_CONF_COLOR.get(email_info['confidence'], Fore.RED)}{email_info['confidence']}{Style.RESET_ALL}")
+    
+    if found:
+        print(f"\n{Fore.GREEN}[+] Found {found} potential email addresses{Style.RESET_ALL}")
+    else:
+        print(f"\n{Fore.YELLOW}[!] No email addresses found{Style.RESET_ALL}")
+
+def main(argv: List[str] = None):
+    """Main function
+    
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    
+    if args.verbose:
+        logging.basicConfig(format='%(levelname)s %(name)s: %(message)s')
+        logger.setLevel(logging.DEBUG)
+    
+    if args.serve:
+        if not hasattr(socket, "AF_UNIX"):
+            parser.error("--serve needs Unix domain sockets, which this platform doesn't support")
+        conn = _connect_daemon(args.socket)
+        if conn is not None:
+            conn.close()
+            parser.error(f"a daemon is already listening on {args.socket}")
+    else:
+        missing = [flag for flag, value in (('--first-name', args.first_name), ('--last-name', args.last_name),
+                                            ('--company', args.company)) if not value]
+        if missing:
+            parser.error(f"the following arguments are required: {', '.join(missing)}")
+        
+        # A running daemon already has a warm finder; hand the query to it, unless
+        # the query sets options that only an in-process finder would honor
+        local_flags = [flag for flag, given in (
+            ('--api-key', args.api_key), ('--api-key-file', args.api_key_file),
+            ('--search-engine-id', args.search_engine_id), ('--config', args.config),
+            ('--no-cache', args.no_cache), ('--cache-ttl', args.cache_ttl != SEARCH_CACHE_TTL),
+            ('--no-headless', args.no_headless), ('--verbose', args.verbose),
+        ) if given]
+        conn = None if args.no_daemon else _connect_daemon(args.socket)
+        if conn is not None and local_flags:
+            conn.close()
+            conn = None
+            print(f"{Fore.YELLOW}[!] Not using the daemon on {args.socket}: {', '.join(local_flags)} "
+                  f"only apply in-process{Style.RESET_ALL}")
+        if conn is not None:
+            print(f"{Fore.BLUE}[*] Sending query to the daemon on {args.socket}{Style.RESET_ALL}")
+            query = {'first_name': args.first_name, 'last_name': args.last_name, 'company': args.company,
+                     'domains': args.domains, 'stop_on_high': args.stop_on_high}
+            try:
+                _print_results(_query_daemon(conn, query))
+            except RuntimeError as e:
+                print(f"{Fore.RED}[!] {str(e)}{Style.RESET_ALL}")
+                sys.exit(1)
+            except KeyboardInterrupt:
+                print(f"\n{Fore.YELLOW}[!] Interrupted{Style.RESET_ALL}")
+                sys.exit(130)
+            return
     
     # If API key is provided as command line argument, use it
-    api_key = args.api_key or os.getenv("GOOGLE_API_KEY", "")
+    api_key = args.api_key
+    if not api_key and args.api_key_file:
+        try:
+            with open(args.api_key_file) as f:
+                api_key = f.read().strip()
+        except OSError as e:
+            parser.error(f"cannot read --api-key-file: {e}")
+        if not api_key:
+            parser.error(f"--api-key-file {args.api_key_file} is empty")
+    api_key = api_key or os.getenv("GOOGLE_API_KEY", "")
     search_engine_id = args.search_engine_id or os.getenv("GOOGLE_SEARCH_ENGINE_ID", "")
     
     finder = EmailFinder(
         headless=not args.no_headless, 
         config_path=args.config,
         api_key=api_key,
-        search_engine_id=search_engine_id
+        search_engine_id=search_engine_id,
+        search_cache_ttl=0 if args.no_cache else args.cache_ttl
     )
     
     try:
-        emails = finder.find_emails(args.first_name, args.last_name, args.company, args.domains)
-        
-        if emails:
-            print(f"\n{Fore.GREEN}[+] Found {len(emails)} potential email addresses:{Style.RESET_ALL}")
-            for i, email_info in enumerate(emails, 1):
-                confidence_color = Fore.GREEN if email_info['confidence'] == 'High' else (Fore.YELLOW if email_info['confidence'] == 'Medium' else Fore.RED)
-                print(f"{i}. {email_info['email']} - Confidence: {confidence_color}{email_info['confidence']}{Style.RESET_ALL}")
+        if args.serve:
+            serve(finder, args.socket)
         else:
-            print(f"\n{Fore.YELLOW}[!] No email addresses found{Style.RESET_ALL}")
+            # Print each address as soon as its domain is verified rather than after all of them
+            _print_results(finder.iter_emails(args.first_name, args.last_name, args.company, args.domains,
+                                              stop_on_high=args.stop_on_high))
     
+    except KeyboardInterrupt:
+        print(f"\n{Fore.YELLOW}[!] Interrupted{Style.RESET_ALL}")
+        sys.exit(130)
     finally:
         finder.cleanup()
 
 if __name__ == '__main__':
+    # Turn SIGTERM into SystemExit so cleanup, atexit hooks and open SMTP
+    # sessions are unwound like on Ctrl-C. Only done when run as a script:
+    # programs calling main() keep their own handler
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
     main()